@@ -1,8 +1,105 @@
 import json
 import csv
+import io
 import re
 import datetime
-from typing import Dict, List, Union, Tuple, Optional
+import functools
+import hashlib
+import string
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Union, Tuple, Optional
+
+# orjson is an optional, faster drop-in for JSON serialization. Parsing stays on the
+# stdlib json module: orjson.loads reads integers >= 2**64 back as floats and rejects
+# lone surrogate escapes and NaN/Infinity literals that json.loads accepts.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Unambiguous ISO 8601 timestamps (days 29-31 excluded), accepted without parsing.
+# re.ASCII keeps \d to 0-9; fromisoformat rejects other Unicode digits.
+_ISO_RE = re.compile(
+    r'^(?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])'
+    r'T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{3}(?:\d{3})?)?'
+    r'(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?\Z',
+    re.ASCII
+)
+
+# Maximum number of generated reports kept per FeedbackJSONSyncAI instance
+_REPORT_CACHE_SIZE = 64
+
+# Batches larger than this send their per-language translation requests concurrently
+_PARALLEL_THRESHOLD = 64
+
+# Every two-letter lowercase code, so validating a language is a single hash lookup
+_LANGUAGE_CODES = frozenset(a + b for a in string.ascii_lowercase for b in string.ascii_lowercase)
+
+
+def _is_language_code(value) -> bool:
+    """
+    Checks whether a value is a two-letter lowercase ISO 639-1 language code.
+    Equivalent to matching r'^[a-z]{2}\Z', without any per-character work.
+    """
+    return isinstance(value, str) and value in _LANGUAGE_CODES
+
+
+@functools.lru_cache(maxsize=4096)
+def _translate_text(text: str, language: str) -> str:
+    """
+    Memoized translation shared by all instances; repeated phrases are not re-translated.
+    """
+    if language == "en":
+        return text
+    
+    # In a real implementation, call a translation API here
+    # For this simulation, we'll just add a note
+    return f"[Translated from {language}] {text}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _synchronize_timestamp(timestamp: str) -> str:
+    """
+    Memoized UTC normalization shared by all instances; repeated timestamps are not re-parsed.
+    """
+    # Whole-second UTC timestamps in extended YYYY-MM-DDTHH:MM:SS form only need a suffix rewrite
+    if len(timestamp) in (20, 25) and _ISO_RE.match(timestamp):
+        if timestamp.endswith("Z"):
+            return timestamp[:-1] + "+00:00"
+        if timestamp.endswith("+00:00"):
+            return timestamp
+    
+    # Parse timestamp and ensure it's in UTC
+    dt = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    return dt.astimezone(datetime.timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
+class Feedback:
+    """
+    A processed feedback record, along with the sentiment details used in the report.
+    """
+    feedback_id: str
+    language: str
+    feedback_text: str
+    timestamp: str
+    sentiment_score: float
+    sentiment_stats: Tuple[float, int, int, int]
+    
+    def to_dict(self) -> Dict:
+        """
+        Converts the record to its structured JSON output form.
+        """
+        return {
+            "feedback_id": self.feedback_id,
+            "language": self.language,
+            "feedback_text": self.feedback_text,
+            "timestamp": self.timestamp,
+            "sentiment_score": self.sentiment_score
+        }
+
 
 class FeedbackJSONSyncAI:
     """
@@ -10,12 +107,63 @@ class FeedbackJSONSyncAI:
     from noisy social media data into structured JSON for sentiment analysis and actionable insights.
     """
     
+    POSITIVE_WORDS = frozenset({"good", "excellent", "great", "happy", "love", "positive", "satisfied"})
+    NEGATIVE_WORDS = frozenset({"bad", "poor", "terrible", "unhappy", "hate", "negative", "dissatisfied"})
+    REQUIRED_FIELDS = ("feedback_id", "language", "feedback_text", "timestamp")
+    OPTIONAL_FIELDS = ("sentiment_score",)
+    # Word -> polarity id (+1 positive, -1 negative) used by the scoring kernel
+    _WORD_IDS: Dict[str, int] = {**dict.fromkeys(POSITIVE_WORDS, 1), **dict.fromkeys(NEGATIVE_WORDS, -1)}
+    
     def __init__(self):
-        self.positive_words = ["good", "excellent", "great", "happy", "love", "positive", "satisfied"]
-        self.negative_words = ["bad", "poor", "terrible", "unhappy", "hate", "negative", "dissatisfied"]
-        self.required_fields = ["feedback_id", "language", "feedback_text", "timestamp"]
-        self.optional_fields = ["sentiment_score"]
+        # Input digest -> generated report, oldest first
+        self._report_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        
+    def _validate_record(self, record: Dict, row_num: int) -> List[str]:
+        """
+        Validates a single feedback record against required fields and data types.
+        
+        Args:
+            record: Feedback record
+            row_num: 1-based row number used in error messages
+            
+        Returns:
+            List of error messages (empty if the record is valid)
+        """
+        error_messages = []
+        
+        # Check for missing required fields
+        missing_fields = [field for field in self.REQUIRED_FIELDS if field not in record or not record[field]]
+        if missing_fields:
+            error_messages.append(f"ERROR: Missing required field(s): {', '.join(missing_fields)} in row {row_num}.")
+        
+        # Check sentiment_score if provided (parse_csv/parse_json already converted it to float)
+        if "sentiment_score" in record and record["sentiment_score"] is not None:
+            score = record["sentiment_score"]
+            if not isinstance(score, (int, float)):
+                error_messages.append(f"ERROR: Invalid data type for the field(s): sentiment_score in row {row_num}. Please ensure correct data types.")
+            elif not -1 <= score <= 1:  # also rejects NaN, which has no JSON representation
+                error_messages.append(f"ERROR: Invalid value for the field(s): sentiment_score in row {row_num}. Score must be between -1 and 1.")
+        
+        # Check feedback_text type (translation and sentiment analysis work on strings)
+        if "feedback_text" in record and record["feedback_text"] and not isinstance(record["feedback_text"], str):
+            error_messages.append(f"ERROR: Invalid data type for the field(s): feedback_text in row {row_num}. Please ensure correct data types.")
+        
+        # Check language format (ISO 639-1)
+        if "language" in record and record["language"]:
+            if not _is_language_code(record["language"]):
+                error_messages.append(f"ERROR: Invalid value for the field(s): language in row {row_num}. Language must be in ISO 639-1 format.")
+        
+        # Check timestamp format (ISO 8601)
+        if "timestamp" in record and record["timestamp"]:
+            try:
+                # Only construct a datetime when the fast shape check fails
+                if not _ISO_RE.match(record["timestamp"]):
+                    datetime.datetime.fromisoformat(record["timestamp"].replace('Z', '+00:00'))
+            except (ValueError, TypeError):
+                error_messages.append(f"ERROR: Invalid value for the field(s): timestamp in row {row_num}. Timestamp must be in ISO 8601 format.")
         
+        return error_messages
+    
     def validate_data(self, data: List[Dict]) -> Tuple[bool, List[str]]:
         """
         Validates the input data against required fields and data types.
@@ -26,79 +174,61 @@ class FeedbackJSONSyncAI:
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        is_valid = True
         error_messages = []
         
         for idx, record in enumerate(data):
-            row_num = idx + 1
-            
-            # Check for missing required fields
-            missing_fields = [field for field in self.required_fields if field not in record or not record[field]]
-            if missing_fields:
-                is_valid = False
-                error_messages.append(f"ERROR: Missing required field(s): {', '.join(missing_fields)} in row {row_num}.")
-            
-            # Check sentiment_score if provided
-            if "sentiment_score" in record and record["sentiment_score"] is not None:
-                try:
-                    score = float(record["sentiment_score"])
-                    if score < -1 or score > 1:
-                        is_valid = False
-                        error_messages.append(f"ERROR: Invalid value for the field(s): sentiment_score in row {row_num}. Score must be between -1 and 1.")
-                except (ValueError, TypeError):
-                    is_valid = False
-                    error_messages.append(f"ERROR: Invalid data type for the field(s): sentiment_score in row {row_num}. Please ensure correct data types.")
-            
-            # Check language format (ISO 639-1)
-            if "language" in record and record["language"]:
-                if not re.match(r'^[a-z]{2}$', record["language"]):
-                    is_valid = False
-                    error_messages.append(f"ERROR: Invalid value for the field(s): language in row {row_num}. Language must be in ISO 639-1 format.")
-            
-            # Check timestamp format (ISO 8601)
-            if "timestamp" in record and record["timestamp"]:
-                try:
-                    datetime.datetime.fromisoformat(record["timestamp"].replace('Z', '+00:00'))
-                except (ValueError, TypeError):
-                    is_valid = False
-                    error_messages.append(f"ERROR: Invalid value for the field(s): timestamp in row {row_num}. Timestamp must be in ISO 8601 format.")
+            error_messages.extend(self._validate_record(record, idx + 1))
         
-        return is_valid, error_messages
+        return not error_messages, error_messages
     
-    def generate_validation_report(self, data: List[Dict]) -> str:
+    def generate_validation_report(self, data: List[Dict], error_messages: Optional[List[str]] = None) -> str:
         """
         Generates a validation report for the data.
         
         Args:
             data: List of feedback records
+            error_messages: Errors already collected for the data (validated here if omitted)
             
         Returns:
             Markdown formatted validation report
         """
-        is_valid, error_messages = self.validate_data(data)
+        if error_messages is None:
+            is_valid, error_messages = self.validate_data(data)
+        else:
+            is_valid = not error_messages
+        
+        # Check field presence across all records in a single pass; each check is
+        # skipped once it has failed, and the scan stops when all of them have
+        fid_ok = lang_ok = text_ok = ts_ok = score_ok = True
+        
+        for record in data:
+            if fid_ok and not record.get("feedback_id"):
+                fid_ok = False
+            if lang_ok and "language" in record and not _is_language_code(record["language"]):
+                lang_ok = False
+            if text_ok and not isinstance(record.get("feedback_text"), str):
+                text_ok = False
+            if ts_ok and not record.get("timestamp"):
+                ts_ok = False
+            
+            # Check sentiment_score validity if provided
+            if score_ok and record.get("sentiment_score") is not None:
+                score = record["sentiment_score"]
+                if not isinstance(score, (int, float)) or not -1 <= score <= 1:
+                    score_ok = False
+            
+            if not (fid_ok or lang_ok or text_ok or ts_ok or score_ok):
+                break
         
-        # Check field presence across all records
         field_status = {
-            "feedback_id": "present" if all("feedback_id" in record and record["feedback_id"] for record in data) else "missing",
-            "language": "valid" if all("language" in record and re.match(r'^[a-z]{2}$', record["language"]) for record in data if "language" in record) else "invalid",
-            "feedback_text": "valid" if all("feedback_text" in record for record in data) else "invalid",
-            "timestamp": "valid" if all("timestamp" in record and record["timestamp"] for record in data) else "invalid",
-            "sentiment_score": "valid"
+            "feedback_id": "present" if fid_ok else "missing",
+            "language": "valid" if lang_ok else "invalid",
+            "feedback_text": "valid" if text_ok else "invalid",
+            "timestamp": "valid" if ts_ok else "invalid",
+            "sentiment_score": "valid" if score_ok else "invalid"
         }
         
-        # Check sentiment_score validity if provided
-        for record in data:
-            if "sentiment_score" in record and record["sentiment_score"] is not None:
-                try:
-                    score = float(record["sentiment_score"])
-                    if score < -1 or score > 1:
-                        field_status["sentiment_score"] = "invalid"
-                        break
-                except (ValueError, TypeError):
-                    field_status["sentiment_score"] = "invalid"
-                    break
-        
-        report = f"""# Customer Feedback Data Validation Report:
+        parts = [f"""# Customer Feedback Data Validation Report:
 - Total Feedback Records: {len(data)}
 ## Required Fields Check:
   feedback_id: {field_status["feedback_id"]}
@@ -108,14 +238,14 @@ class FeedbackJSONSyncAI:
   sentiment_score: {field_status["sentiment_score"]}
 
 ## Validation Status:
-"""
+"""]
         
         if is_valid:
-            report += "Data validation is successful! Would you like to proceed with the analysis or provide another dataset?"
+            parts.append("Data validation is successful! Would you like to proceed with the analysis or provide another dataset?")
         else:
-            report += "\n".join(error_messages)
+            parts.append("\n".join(error_messages))
         
-        return report
+        return "".join(parts)
     
     def translate_feedback(self, text: str, language: str) -> str:
         """
@@ -129,12 +259,57 @@ class FeedbackJSONSyncAI:
         Returns:
             Translated text (or original if language is English)
         """
-        if language == "en":
-            return text
+        return _translate_text(text, language)
+    
+    def _translate_group(self, texts: List[str], language: str) -> List[str]:
+        """
+        Translates texts that share a language to English in a single request.
         
-        # In a real implementation, call a translation API here
-        # For this simulation, we'll just add a note
-        return f"[Translated from {language}] {text}"
+        Args:
+            texts: Feedback texts, all in the same language
+            language: The language code of the texts
+            
+        Returns:
+            Translated texts, in the same order as texts
+        """
+        # In a real implementation, send all texts in one translation API request here
+        # For this simulation, each text gets the same note as translate_feedback
+        return [_translate_text(text, language) for text in texts]
+    
+    def translate_batch(self, items: List[Tuple[str, str]]) -> List[str]:
+        """
+        Translates many feedback texts to English, issuing one batched request per language
+        instead of one per text. Large batches send the per-language requests concurrently.
+        
+        Args:
+            items: List of (text, language) pairs
+            
+        Returns:
+            Translated texts, in the same order as items
+        """
+        translations = [None] * len(items)
+        
+        # Group item positions by language
+        groups: Dict[str, List[int]] = {}
+        for idx, (_, language) in enumerate(items):
+            groups.setdefault(language, []).append(idx)
+        
+        languages = list(groups)
+        texts = [[items[idx][0] for idx in groups[language]] for language in languages]
+        
+        # Overlap request latency across languages; small batches aren't worth the pool
+        if len(items) > _PARALLEL_THRESHOLD and len(languages) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(languages))) as executor:
+                results = list(executor.map(self._translate_group, texts, languages))
+        else:
+            results = [self._translate_group(group, language) for group, language in zip(texts, languages)]
+        
+        # Scatter translations back to their original positions
+        for language, translated in zip(languages, results):
+            for idx, text in zip(groups[language], translated):
+                translations[idx] = text
+        
+        return translations
     
     def synchronize_timestamp(self, timestamp: str) -> str:
         """
@@ -146,9 +321,7 @@ class FeedbackJSONSyncAI:
         Returns:
             Synchronized timestamp in ISO 8601 format
         """
-        # Parse timestamp and ensure it's in UTC
-        dt = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        return dt.astimezone(datetime.timezone.utc).isoformat()
+        return _synchronize_timestamp(timestamp)
     
     def calculate_sentiment_score(self, text: str) -> Tuple[float, int, int, int]:
         """
@@ -160,15 +333,16 @@ class FeedbackJSONSyncAI:
         Returns:
             Tuple of (sentiment_score, positive_count, negative_count, total_words)
         """
-        # Convert to lowercase for case-insensitive matching
-        lower_text = text.lower()
+        # Tokenize once, lowercased for case-insensitive matching
+        tokens = text.lower().split()
         
-        # Count positive and negative words
-        positive_count = sum(1 for word in self.positive_words if word in lower_text.split())
-        negative_count = sum(1 for word in self.negative_words if word in lower_text.split())
+        # Map tokens to polarity ids, then count positive and negative words
+        polarities = list(map(self._WORD_IDS.get, tokens))
+        positive_count = polarities.count(1)
+        negative_count = polarities.count(-1)
         
         # Count total words
-        total_words = len(lower_text.split())
+        total_words = len(tokens)
         
         # Calculate sentiment score
         if total_words > 0:
@@ -181,7 +355,37 @@ class FeedbackJSONSyncAI:
         
         return sentiment_score, positive_count, negative_count, total_words
     
-    def process_feedback(self, data: List[Dict]) -> List[Dict]:
+    def _process_record(self, record: Dict, feedback_text: str) -> Feedback:
+        """
+        Processes a single feedback record with sentiment analysis and timestamp synchronization.
+        
+        Args:
+            record: Validated feedback record
+            feedback_text: The record's feedback text, already translated to English
+            
+        Returns:
+            Processed feedback record
+        """
+        # Calculate sentiment details once; the detailed report reuses them
+        sentiment_stats = self.calculate_sentiment_score(feedback_text)
+        
+        # Use the calculated sentiment score if not provided
+        if "sentiment_score" not in record or record["sentiment_score"] is None:
+            sentiment_score = sentiment_stats[0]
+        else:
+            sentiment_score = record["sentiment_score"]
+        
+        # Build a new record to avoid modifying the original
+        return Feedback(
+            feedback_id=record["feedback_id"],
+            language=record["language"],
+            feedback_text=feedback_text,
+            timestamp=self.synchronize_timestamp(record["timestamp"]),
+            sentiment_score=sentiment_score,
+            sentiment_stats=sentiment_stats
+        )
+    
+    def process_feedback(self, data: List[Dict]) -> List[Feedback]:
         """
         Processes each feedback record with translation, sentiment analysis, and timestamp synchronization.
         
@@ -191,29 +395,51 @@ class FeedbackJSONSyncAI:
         Returns:
             Processed feedback records
         """
-        processed_data = []
+        # Translate all non-English feedback in one batch and scatter results back by index
+        feedback_texts = [record["feedback_text"] for record in data]
+        to_translate = [(idx, record["feedback_text"], record["language"]) for idx, record in enumerate(data) if record["language"] != "en"]
+        translations = self.translate_batch([(text, language) for _, text, language in to_translate])
+        for (idx, _, _), translated in zip(to_translate, translations):
+            feedback_texts[idx] = translated
         
-        for record in data:
-            # Create a new record to avoid modifying the original
-            processed_record = {
-                "feedback_id": record["feedback_id"],
-                "language": record["language"],
-                "feedback_text": self.translate_feedback(record["feedback_text"], record["language"]),
-                "timestamp": self.synchronize_timestamp(record["timestamp"])
-            }
-            
-            # Calculate sentiment score if not provided
-            if "sentiment_score" not in record or record["sentiment_score"] is None:
-                sentiment_score, _, _, _ = self.calculate_sentiment_score(processed_record["feedback_text"])
-                processed_record["sentiment_score"] = sentiment_score
-            else:
-                processed_record["sentiment_score"] = float(record["sentiment_score"])
-            
-            processed_data.append(processed_record)
+        processed_data = [None] * len(data)
+        
+        for idx, record in enumerate(data):
+            processed_data[idx] = self._process_record(record, feedback_texts[idx])
         
         return processed_data
     
-    def generate_detailed_report(self, data: List[Dict], processed_data: List[Dict]) -> str:
+    def process_stream(self, records: Iterable[Dict]) -> Tuple[List[str], List[Feedback]]:
+        """
+        Validates and processes feedback records in two phases. The first pass validates
+        every record and buffers the valid ones; once an invalid record is found, buffering
+        stops but validation continues so that every error is still reported. If all records
+        are valid, the buffer is then processed by process_feedback, which needs the whole
+        batch to translate it in one request per language.
+        
+        Args:
+            records: Iterable of feedback records
+            
+        Returns:
+            Tuple of (error_messages, processed_data)
+        """
+        error_messages = []
+        valid_records = []
+        
+        for idx, record in enumerate(records):
+            record_errors = self._validate_record(record, idx + 1)
+            if record_errors:
+                error_messages.extend(record_errors)
+            elif not error_messages:
+                valid_records.append(record)
+        
+        if error_messages:
+            return error_messages, []
+        
+        # Processing needs the whole batch so translations go out in one request per language
+        return error_messages, self.process_feedback(valid_records)
+    
+    def generate_detailed_report(self, data: List[Dict], processed_data: List[Feedback]) -> str:
         """
         Generates a detailed report with processing steps for each feedback.
         
@@ -224,19 +450,19 @@ class FeedbackJSONSyncAI:
         Returns:
             Markdown formatted detailed report
         """
-        report = f"""# Customer Feedback JSON Summary
+        parts = [f"""# Customer Feedback JSON Summary
 
 **Total Feedback Records Evaluated:** {len(data)}
 
 ---
 
-"""
+"""]
         
-        for idx, (original, processed) in enumerate(zip(data, processed_data)):
-            # Calculate sentiment analysis details
-            sentiment_score, positive_count, negative_count, total_words = self.calculate_sentiment_score(processed["feedback_text"])
+        for original, processed in zip(data, processed_data):
+            # Sentiment analysis details cached by _process_record
+            sentiment_score, positive_count, negative_count, total_words = processed.sentiment_stats
             
-            report += f"""## Detailed Analysis per Feedback
+            parts.append(f"""## Detailed Analysis per Feedback
 
 ### Feedback: {original["feedback_id"]}
 
@@ -251,7 +477,7 @@ class FeedbackJSONSyncAI:
 ## Processing Steps
 
 ### 1. Translation Check
-- **IF** language is not "en", **THEN** the translated text is: {processed["feedback_text"]}
+- **IF** language is not "en", **THEN** the translated text is: {processed.feedback_text}
 - **ELSE**: Use the original text.
 
 ### 2. Sentiment Analysis Calculation
@@ -260,28 +486,38 @@ class FeedbackJSONSyncAI:
 - **Total Words:** {total_words}
 - **Calculation:**  
   $$ \\text{{sentiment\\_score}} = \\frac{{({positive_count} - {negative_count})}}{{total\\_words}} = \\frac{{{positive_count - negative_count}}}{{{total_words}}} = {sentiment_score} $$
-- **Final Sentiment Score:** {processed["sentiment_score"]}
+- **Final Sentiment Score:** {processed.sentiment_score}
 
 ### 3. Timestamp Synchronization
-- **Synchronized Timestamp:** {processed["timestamp"]}
+- **Synchronized Timestamp:** {processed.timestamp}
 
 ---
 
-"""
+""")
         
         # Add structured JSON output
-        report += """## Structured JSON OUTPUT
+        parts.append("""## Structured JSON OUTPUT
 
 ```json
-"""
+""")
         
         json_output = {
-            "feedbacks": processed_data
+            "feedbacks": [processed.to_dict() for processed in processed_data]
         }
-        report += json.dumps(json_output, indent=2)
-        report += "\n```"
-        
-        return report
+        # Output depends on the backend: orjson writes floats without exponents (0.00001, not 1e-05).
+        # Values orjson cannot encode (integers beyond 64 bits, lone surrogates) fall back to json.dumps.
+        json_text = None
+        if orjson:
+            try:
+                json_text = orjson.dumps(json_output, option=orjson.OPT_INDENT_2).decode()
+            except orjson.JSONEncodeError:
+                pass
+        if json_text is None:
+            json_text = json.dumps(json_output, indent=2, ensure_ascii=False)
+        parts.append(json_text)
+        parts.append("\n```")
+        
+        return "".join(parts)
     
     def parse_csv(self, csv_data: str) -> List[Dict]:
         """
@@ -295,7 +531,8 @@ class FeedbackJSONSyncAI:
         """
         records = []
         try:
-            csv_reader = csv.DictReader(csv_data.strip().split('\n'))
+            # Read rows straight from the buffer instead of a materialized list of lines
+            csv_reader = csv.DictReader(io.StringIO(csv_data.strip(), newline=''))
             for row in csv_reader:
                 # Convert empty string sentiment_score to None
                 if "sentiment_score" in row and (not row["sentiment_score"] or row["sentiment_score"].lower() == "null"):
@@ -339,6 +576,29 @@ class FeedbackJSONSyncAI:
     def process_data(self, data_input: str) -> str:
         """
         Processes the input data and generates a report.
+        Reports for recently seen inputs are returned from cache.
+        
+        Args:
+            data_input: Input data in CSV or JSON format
+            
+        Returns:
+            Markdown formatted report
+        """
+        key = hashlib.blake2b(data_input.encode(errors="surrogatepass"), digest_size=16).digest()
+        report = self._report_cache.get(key)
+        if report is not None:
+            self._report_cache.move_to_end(key)
+            return report
+        
+        report = self._generate_report(data_input)
+        self._report_cache[key] = report
+        if len(self._report_cache) > _REPORT_CACHE_SIZE:
+            self._report_cache.popitem(last=False)
+        return report
+    
+    def _generate_report(self, data_input: str) -> str:
+        """
+        Parses, validates and processes the input data, then generates the matching report.
         
         Args:
             data_input: Input data in CSV or JSON format
@@ -355,13 +615,10 @@ class FeedbackJSONSyncAI:
         except ValueError as e:
             return str(e)
         
-        # Validate data
-        is_valid, error_messages = self.validate_data(data)
-        if not is_valid:
-            return self.generate_validation_report(data)
-        
-        # Process the valid data
-        processed_data = self.process_feedback(data)
+        # Validate all records, then process the batch if they are all valid
+        error_messages, processed_data = self.process_stream(data)
+        if error_messages:
+            return self.generate_validation_report(data, error_messages)
         
         # Generate detailed report
         return self.generate_detailed_report(data, processed_data)